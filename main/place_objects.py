@@ -9,25 +9,101 @@ Requirements:
 - Python 3.9+
 - pyautogui
 - pillow
-- opencv-python (for confidence-based template matching)
+- opencv-python (for finding the object browser anchor)
+- mss
+- numpy
 """
 from __future__ import annotations
 
 import argparse
+import itertools
+import os
 import sys
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, Protocol, TextIO, TypeVar
 
+import cv2
+import mss
+import mss.exception
+import numpy as np
 import pyautogui
 
 
+# Coarse pyramid levels stop before the template would shrink below this size.
+PYRAMID_MIN_TEMPLATE = 8
+PYRAMID_MAX_LEVELS = 3
+
+# precise_sleep hands this much of each delay to a busy-wait instead of the OS.
+SPIN_MARGIN = 0.002
+
+# Screen pixels for the clicking workflow, metres for the 3DEN script.
+Coord = TypeVar("Coord", int, float)
+EntryT = TypeVar("EntryT", contravariant=True)
+PosT = TypeVar("PosT", contravariant=True)
+
+_SCT: Optional[mss.base.MSSBase] = None
+_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _sct() -> mss.base.MSSBase:
+    """Return the capture handle shared by every screen read.
+
+    It is created on first use and kept for the whole run, so mss sets up its
+    platform state (GDI device contexts, the X11 connection) once rather than
+    per grab, and importing the module or a dry run never touches the display.
+    """
+
+    global _SCT
+    if _SCT is None:
+        _SCT = mss.mss()
+    return _SCT
+
+
+def _pool() -> ThreadPoolExecutor:
+    """Return the worker pool used to match screen stripes in parallel.
+
+    Created on first use with one worker per CPU and kept for later searches.
+    """
+
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _POOL
+
+
+def match_template(screen: np.ndarray, tpl: np.ndarray) -> np.ndarray:
+    """Return ``cv2.matchTemplate`` scores for ``tpl`` over ``screen``.
+
+    The screen is cut into horizontal stripes, one per worker, that overlap
+    by the template height minus one so every position is scored exactly
+    once, and the stripes are matched concurrently. OpenCV releases the GIL while matching,
+    so threads scale without copying the screen into other processes. The
+    stitched result is identical to a single ``matchTemplate`` call.
+    """
+
+    tpl_h = tpl.shape[0]
+    fit_rows = screen.shape[0] - tpl_h + 1
+    stripes = min(os.cpu_count() or 1, fit_rows // tpl_h)
+    if stripes <= 1:
+        return cv2.matchTemplate(screen, tpl, cv2.TM_CCOEFF_NORMED)
+
+    def match_stripe(rows: tuple[int, int]) -> np.ndarray:
+        y0, y1 = rows
+        return cv2.matchTemplate(screen[y0 : y1 + tpl_h - 1], tpl, cv2.TM_CCOEFF_NORMED)
+
+    bounds = np.linspace(0, fit_rows, stripes + 1, dtype=int)
+    return np.vstack(list(_pool().map(match_stripe, zip(bounds, bounds[1:]))))
+
+
 @dataclass
 class PlacementConfig:
     """Runtime configuration for controlling placement behaviour."""
 
-    anchor_template: Path
+    anchor_template: Optional[Path]
     row_height: int = 26
     list_offset_x: int = 10
     list_offset_y: int = 40
@@ -40,32 +116,115 @@ class PlacementConfig:
     scroll_delay: float = 0.15
     limit: Optional[int] = None
     confidence: float = 0.9
+    search_region: Optional[tuple[int, int, int, int]] = None
     placement_origin: Optional[tuple[int, int]] = None
     category_color: Optional[tuple[int, int, int]] = None
     category_color_tolerance: int = 8
     category_icon_offset_x: int = -14
+    class_list: Optional[Path] = None
+    sqf_out: Optional[Path] = None
+    spacing_meters: float = 5.0
     dry_run: bool = False
+    template_gray: Optional[np.ndarray] = field(default=None, repr=False)
 
 
-def locate_anchor(template: Path, confidence: float) -> pyautogui.Box:
-    """Locate the supplied template on the current screen.
+def load_template(template: Path) -> np.ndarray:
+    """Read the anchor template from disk as a grayscale array.
 
-    The template should be a cropped screenshot of a stable UI element at the top
-    of the 3DEN object browser, e.g., the "Entities" header. A failure to find it
-    raises a RuntimeError.
+    Raises a RuntimeError if the file is missing or cannot be decoded.
     """
 
     if not template.exists():
         raise RuntimeError(f"anchor template not found: {template}")
 
-    location = pyautogui.locateOnScreen(str(template), confidence=confidence)
-    if location is None:
+    tpl = cv2.imread(str(template), cv2.IMREAD_GRAYSCALE)
+    if tpl is None:
+        raise RuntimeError(f"could not read anchor template: {template}")
+
+    return tpl
+
+
+def locate_anchor(cfg: PlacementConfig) -> pyautogui.Box:
+    """Locate the configured anchor template on the current screen.
+
+    The template should be a cropped screenshot of a stable UI element at the top
+    of the 3DEN object browser, e.g., the "Entities" header. It is matched from
+    ``cfg.template_gray`` when already loaded, otherwise read from
+    ``cfg.anchor_template``. Only ``cfg.search_region`` (left, top, width,
+    height relative to the primary monitor) is searched when set, otherwise
+    the whole primary monitor. A failure to find it raises a RuntimeError.
+    """
+
+    if cfg.template_gray is None:
+        if cfg.anchor_template is None:
+            raise RuntimeError("No anchor template to locate")
+        cfg.template_gray = load_template(cfg.anchor_template)
+    tpl = cfg.template_gray
+    confidence = cfg.confidence
+
+    sct = _sct()
+    monitor = sct.monitors[1]
+    if cfg.search_region is not None:
+        left, top, width, height = cfg.search_region
+        if (
+            width <= 0
+            or height <= 0
+            or left < 0
+            or top < 0
+            or left + width > monitor["width"]
+            or top + height > monitor["height"]
+        ):
+            raise RuntimeError(
+                f"search region {cfg.search_region} does not fit on the primary "
+                f"monitor ({monitor['width']}x{monitor['height']})"
+            )
+        monitor = {
+            "left": monitor["left"] + left,
+            "top": monitor["top"] + top,
+            "width": width,
+            "height": height,
+        }
+    try:
+        shot = sct.grab(monitor)
+    except mss.exception.ScreenShotError as exc:
+        raise RuntimeError(f"could not capture the anchor search region: {exc}") from exc
+    screen = cv2.cvtColor(np.asarray(shot), cv2.COLOR_BGRA2GRAY)
+
+    tpl_h, tpl_w = tpl.shape
+    if tpl_h > screen.shape[0] or tpl_w > screen.shape[1]:
+        raise RuntimeError("anchor template is larger than the search region")
+
+    # Find the rough position on a downsampled copy first, then only match at
+    # full resolution in a small window around it.
+    screen_lo, tpl_lo = screen, tpl
+    levels = 0
+    while (
+        levels < PYRAMID_MAX_LEVELS
+        and min(tpl_lo.shape) // 2 >= PYRAMID_MIN_TEMPLATE
+    ):
+        screen_lo, tpl_lo = cv2.pyrDown(screen_lo), cv2.pyrDown(tpl_lo)
+        levels += 1
+
+    scale = 1 << levels
+    _, _, _, (peak_x, peak_y) = cv2.minMaxLoc(match_template(screen_lo, tpl_lo))
+
+    step = 2 * scale
+    x0 = max(0, peak_x * scale - step)
+    y0 = max(0, peak_y * scale - step)
+    roi = screen[y0 : y0 + tpl_h + 2 * step, x0 : x0 + tpl_w + 2 * step]
+    _, score, _, (fine_x, fine_y) = cv2.minMaxLoc(
+        cv2.matchTemplate(roi, tpl, cv2.TM_CCOEFF_NORMED)
+    )
+
+    if score < confidence:
         raise RuntimeError(
             "Could not find anchor on screen. Make sure the 3DEN object browser "
             "is visible and matches the template screenshot."
         )
 
-    return location
+    return pyautogui.Box(
+        monitor["left"] + x0 + fine_x, monitor["top"] + y0 + fine_y, tpl_w, tpl_h
+    )
 
 
 def safe_screen_height(default: int = 1080) -> int:
@@ -77,40 +236,362 @@ def safe_screen_height(default: int = 1080) -> int:
         return default
 
 
-def is_category_row(list_x: int, list_y: int, cfg: PlacementConfig) -> bool:
-    """Detect whether the current row is a category header (triangle icon).
+def precise_sleep(seconds: float) -> None:
+    """Sleep for ``seconds`` without overshooting by a scheduler tick.
+
+    ``time.sleep`` can round short waits up to the OS timer granularity
+    (10-15 ms on Windows by default). Sleep for all but the last couple of
+    milliseconds, then spin on ``time.perf_counter`` until the deadline.
+    """
+
+    end = time.perf_counter() + seconds
+    if seconds > SPIN_MARGIN:
+        time.sleep(seconds - SPIN_MARGIN)
+    while time.perf_counter() < end:
+        pass
+
+
+@contextmanager
+def fine_timer_resolution() -> Iterator[None]:
+    """Raise the Windows scheduler resolution to 1 ms for the duration.
 
-    If ``category_color`` is provided, the script samples the pixel at
-    ``list_x + category_icon_offset_x`` to see if it matches the expected
-    color. This keeps the script from clicking category rows when iterating
-    down the list. Returns ``False`` when no color is configured.
+    Does nothing on other platforms, whose sleep granularity is already fine.
     """
 
+    if sys.platform != "win32":
+        yield
+        return
+
+    import ctypes
+
+    winmm = ctypes.windll.winmm
+    winmm.timeBeginPeriod(1)
+    try:
+        yield
+    finally:
+        winmm.timeEndPeriod(1)
+
+
+def native_cursor_mover() -> Callable[[int, int], None]:
+    """Return a function that warps the cursor with a single native call.
+
+    PyAutoGUI's ``moveTo`` goes through its own tweening and pause handling on
+    every call; the placement loop only needs the pointer to jump, so use the
+    platform API directly. Falls back to ``pyautogui.moveTo`` when the
+    platform bindings (python-xlib on Linux, pyobjc-Quartz on macOS) are not
+    available.
+    """
+
+    if sys.platform == "win32":
+        import ctypes
+
+        return ctypes.windll.user32.SetCursorPos
+
+    try:
+        if sys.platform == "darwin":
+            import Quartz
+
+            return lambda x, y: Quartz.CGWarpMouseCursorPosition((x, y))
+
+        from Xlib.display import Display
+
+        display = Display()
+    except Exception:
+        return pyautogui.moveTo
+
+    root = display.screen().root
+
+    def warp(x: int, y: int) -> None:
+        root.warp_pointer(x, y)
+        display.sync()
+
+    return warp
+
+
+def native_clicker(move: Callable[[int, int], None]) -> Callable[[int, int], None]:
+    """Return a function that moves the cursor with ``move`` and left-clicks.
+
+    On Windows the button press and release are sent together in one
+    ``SendInput`` call from a buffer built once here, so a click costs a
+    single trip into the kernel and allocates nothing. Other platforms press
+    the button through PyAutoGUI.
+    """
+
+    if sys.platform != "win32":
+
+        def pyautogui_click_at(x: int, y: int) -> None:
+            move(x, y)
+            pyautogui.mouseDown()
+            pyautogui.mouseUp()
+
+        return pyautogui_click_at
+
+    import ctypes
+    from ctypes import wintypes
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    # MOUSEINPUT is the largest member of the INPUT union, so this has the
+    # size SendInput expects.
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("mi", MOUSEINPUT)]
+
+    input_mouse = 0
+    mouseeventf_leftdown = 0x0002
+    mouseeventf_leftup = 0x0004
+
+    buttons = (INPUT * 2)()
+    for event, flags in zip(buttons, (mouseeventf_leftdown, mouseeventf_leftup)):
+        event.type = input_mouse
+        event.mi.dwFlags = flags
+    send_input = ctypes.windll.user32.SendInput
+    input_size = ctypes.sizeof(INPUT)
+
+    def sendinput_click_at(x: int, y: int) -> None:
+        # SendInput bypasses PyAutoGUI, so check the fail-safe corner here.
+        pyautogui.failSafeCheck()
+        move(x, y)
+        send_input(2, buttons, input_size)
+
+    return sendinput_click_at
+
+
+def tol_match_col(column: np.ndarray, target: np.ndarray, tol: int) -> np.ndarray:
+    """Return which pixels of ``column`` are within ``tol`` of ``target``.
+
+    ``column`` is an H x W x 3 uint8 capture and ``target`` a uint8 color,
+    either a single pixel or already tiled to the capture's shape. A pixel
+    matches when no channel differs by more than ``tol``; ``cv2.absdiff``
+    takes the difference directly on uint8 without widening to a signed type.
+    """
+
+    if target.shape != column.shape:
+        target = np.ascontiguousarray(np.broadcast_to(target, column.shape))
+    return cv2.absdiff(column, target).max(axis=-1) <= tol
+
+
+def category_sampler(
+    list_x: int, list_y: int, visible_rows: int, cfg: PlacementConfig
+) -> Callable[[], np.ndarray]:
+    """Build a function that detects which visible rows are category headers.
+
+    If ``category_color`` is provided, the returned function samples the pixel
+    at ``list_x + category_icon_offset_x`` on every visible row to see if it
+    matches the expected color (triangle icon). This keeps the script from
+    clicking category rows when iterating down the list. The column is
+    captured in a single grab, so it only needs to be called again after the
+    list scrolls.
+
+    The function returns one boolean per visible row, all ``False`` when no
+    color is configured or the capture fails. Everything that does not change
+    between pages is worked out here rather than on every call.
+    """
+
+    no_categories = np.zeros(visible_rows, dtype=bool)
     if cfg.category_color is None:
-        return False
+        return lambda: no_categories
+
+    sct = _sct()
+    region = {
+        "left": list_x + cfg.category_icon_offset_x,
+        "top": list_y,
+        "width": 1,
+        "height": (visible_rows - 1) * cfg.row_height + 1,
+    }
+    row_step = cfg.row_height
+    # mss hands back BGRA, so compare against the configured RGB reversed.
+    target = np.array(cfg.category_color[::-1], np.uint8)
+    target_column = np.tile(target, (visible_rows, 1, 1))
+    tolerance = cfg.category_color_tolerance
+
+    def sample() -> np.ndarray:
+        try:
+            shot = sct.grab(region)
+        except Exception:
+            return no_categories
+
+        # View the capture buffer in place and only copy the sampled pixels.
+        samples = np.ascontiguousarray(np.asarray(shot)[::row_step, :1, :3])
+        mask = tol_match_col(samples, target_column, tolerance)[:, 0]
+        return mask if mask.any() else no_categories
+
+    return sample
+
+
+def grid_positions(
+    origin: tuple[Coord, Coord], per_row: int, spacing: Coord, limit: Optional[int]
+) -> Iterable[tuple[Coord, Coord]]:
+    """Return the positions to place objects at, in placement order.
+
+    Objects fill rows of ``per_row`` columns, ``spacing`` apart, starting at
+    ``origin``. When ``limit`` is known the whole plan is built up
+    front; otherwise positions are generated as the run needs them.
+    """
+
+    ox, oy = origin
+    col_pix = tuple(ox + c * spacing for c in range(per_row))
+    if limit is not None:
+        return [
+            (col_pix[i % per_row], oy + (i // per_row) * spacing)
+            for i in range(limit)
+        ]
+    return (
+        (x, oy + row * spacing) for row in itertools.count() for x in col_pix
+    )
+
+
+class PlacementBackend(Protocol[EntryT, PosT]):
+    """Something that can put one object from the catalog into the scene.
+
+    ``entry`` identifies the object in whatever way the backend selects it
+    (a list position on screen, a class name), and ``world_pos`` is where it
+    goes in that backend's coordinates.
+    """
+
+    def place_one(self, entry: EntryT, world_pos: PosT) -> None:
+        ...
+
+
+class PixelBackend:
+    """Click a list entry in the object browser, then click the viewport."""
+
+    def __init__(self, cfg: PlacementConfig) -> None:
+        self.click_at = native_clicker(native_cursor_mover())
+        self.click_delay = cfg.click_delay
+        self.place_delay = cfg.place_delay
+
+    def place_one(self, entry: tuple[int, int], world_pos: tuple[int, int]) -> None:
+        self.click_at(*entry)
+        precise_sleep(self.click_delay)
+
+        self.click_at(*world_pos)
+        precise_sleep(self.place_delay)
+
+
+class DryRunBackend:
+    """Print the clicks the pixel backend would make."""
+
+    def place_one(self, entry: tuple[int, int], world_pos: tuple[int, int]) -> None:
+        print(f"Would click list entry at {entry} and place at {world_pos}")
+
+
+def _sqf_number(value: float) -> str:
+    """Format a world offset in metres for SQF, to the millimetre.
+
+    Fixed-point keeps large offsets out of exponent notation and trailing
+    zeros are dropped. Adding 0.0 after rounding turns -0.0 into 0.0 so the
+    first row is not written as "-0".
+    """
+
+    return f"{round(value, 3) + 0.0:.3f}".rstrip("0").rstrip(".")
+
+
+class EdenScriptBackend:
+    """Write one ``create3DENEntity`` call per object to an SQF script.
+
+    Arma 3 only runs 3DEN commands from inside the editor, so rather than
+    driving the UI this produces a script to execute from the editor's debug
+    console. Positions are metre offsets from the point in the middle of the
+    editor camera's view; columns run east and rows run south, like the grid
+    the pixel workflow lays out on screen.
+    """
+
+    def __init__(self, out: TextIO) -> None:
+        self.out = out
+        out.write("private _origin = screenToWorld [0.5, 0.5];\n")
+
+    def place_one(self, entry: str, world_pos: tuple[float, float]) -> None:
+        name = entry.replace('"', '""')
+        # Screen rows grow downwards, world y grows north.
+        dx, dy = _sqf_number(world_pos[0]), _sqf_number(-world_pos[1])
+        self.out.write(
+            f'create3DENEntity ["Object", "{name}", _origin vectorAdd [{dx}, {dy}, 0]];\n'
+        )
+
+
+def read_class_list(path: Path) -> list[str]:
+    """Return the class names listed in ``path``, one per line.
+
+    Blank lines and lines starting with ``#`` or ``//`` are ignored.
+    """
+
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError as exc:
+        raise RuntimeError(f"could not read class list: {exc}") from exc
+
+    return [
+        line.strip()
+        for line in lines
+        if line.strip() and not line.lstrip().startswith(("#", "//"))
+    ]
+
+
+def write_placement_script(cfg: PlacementConfig) -> None:
+    """Place every class in ``cfg.class_list`` through the 3DEN scripting API.
+
+    No screen reading or clicking is involved: each class name goes straight
+    to :class:`EdenScriptBackend`, laid out on the same ``per_row`` grid as
+    the pixel workflow but ``spacing_meters`` apart. The script goes to
+    ``sqf_out``, or is printed when that is unset or on a dry run.
+    """
+
+    if cfg.class_list is None:
+        raise RuntimeError("No class list to place from")
+    classes = read_class_list(cfg.class_list)
+    if cfg.limit is not None:
+        classes = classes[: cfg.limit]
 
-    icon_x = list_x + cfg.category_icon_offset_x
+    positions = grid_positions((0.0, 0.0), cfg.per_row, cfg.spacing_meters, len(classes))
+    write_to = None if cfg.dry_run else cfg.sqf_out
     try:
-        return pyautogui.pixelMatchesColor(
-            icon_x,
-            list_y,
-            cfg.category_color,
-            tolerance=cfg.category_color_tolerance,
+        target = (
+            open(write_to, "w", encoding="utf-8")
+            if write_to is not None
+            else nullcontext(sys.stdout)
         )
-    except Exception:
-        return False
+    except OSError as exc:
+        raise RuntimeError(f"could not write placement script: {exc}") from exc
+    with target as out:
+        backend: PlacementBackend[str, tuple[float, float]] = EdenScriptBackend(out)
+        for class_name, world_pos in zip(classes, positions):
+            backend.place_one(class_name, world_pos)
+
+    if write_to is not None:
+        print(f"Wrote {len(classes)} placements to {write_to}")
+    elif cfg.sqf_out is not None:
+        print(f"Would write {len(classes)} placements to {cfg.sqf_out}")
 
 
 def place_objects(cfg: PlacementConfig) -> None:
-    """Drive the mouse to click each object and place it in a grid."""
+    """Drive the mouse to click each object and place it in a grid.
+
+    With ``class_list`` set, the objects are placed through the 3DEN
+    scripting API instead (see :func:`write_placement_script`).
+    """
+
+    if cfg.class_list is not None:
+        write_placement_script(cfg)
+        return
 
     anchor = (
         pyautogui.Box(0, 0, 0, 0)
         if cfg.dry_run
-        else locate_anchor(cfg.anchor_template, cfg.confidence)
+        else locate_anchor(cfg)
     )
 
     pyautogui.FAILSAFE = True
+    # The configured click/place/scroll delays already pace the UI; don't let
+    # PyAutoGUI add its own pause after every call on top of them.
+    pyautogui.PAUSE = 0
 
     list_start_x = anchor.left + cfg.list_offset_x
     list_start_y = anchor.top + cfg.list_offset_y
@@ -119,55 +600,87 @@ def place_objects(cfg: PlacementConfig) -> None:
     screen_height = cfg.screen_height or safe_screen_height()
     visible_rows = max(1, (screen_height - list_start_y) // cfg.row_height)
 
+    # Bind the config values the loop reads to locals once instead of looking
+    # the attributes up again for every row.
+    dry_run = cfg.dry_run
+    limit = cfg.limit
+    scroll_delay = cfg.scroll_delay
+    sx, sy = list_start_x, list_start_y
+    # Entry positions only depend on the row within the page, and placement
+    # positions only on how many objects are down, so look both up instead
+    # of recomputing them for every placement.
+    list_plan = tuple((sx, sy + r * cfg.row_height) for r in range(visible_rows))
+    world_plan = iter(
+        grid_positions(placement_origin, cfg.per_row, cfg.spacing_pixels, limit)
+    )
+    page_scroll = -cfg.scroll_clicks_per_row * visible_rows
+    backend: PlacementBackend[tuple[int, int], tuple[int, int]] = (
+        DryRunBackend() if dry_run else PixelBackend(cfg)
+    )
+    place_one = backend.place_one
+    sample_categories = (
+        (lambda: np.zeros(visible_rows, dtype=bool))
+        if dry_run
+        else category_sampler(sx, sy, visible_rows, cfg)
+    )
+
     scroll_rows_consumed = 0
     placed = 0
     index = 0
+    cat_rows: Optional[np.ndarray] = None
 
-    while cfg.limit is None or placed < cfg.limit:
+    while limit is None or placed < limit:
         row_in_view = index - scroll_rows_consumed
         if row_in_view >= visible_rows:
-            rows_to_scroll = row_in_view - visible_rows + 1
-            scroll_amount = -cfg.scroll_clicks_per_row * rows_to_scroll
-            if not cfg.dry_run:
-                pyautogui.scroll(scroll_amount, x=list_start_x, y=list_start_y)
-                time.sleep(cfg.scroll_delay)
-            scroll_rows_consumed += rows_to_scroll
-            row_in_view = index - scroll_rows_consumed
-
-        list_pos = (list_start_x, list_start_y + row_in_view * cfg.row_height)
-
-        if not cfg.dry_run and is_category_row(list_pos[0], list_pos[1], cfg):
+            # Scroll a whole page at once so the next visible_rows entries
+            # need no further scrolling (or category sampling).
+            if not dry_run:
+                pyautogui.scroll(page_scroll, x=sx, y=sy)
+                precise_sleep(scroll_delay)
+            scroll_rows_consumed += visible_rows
+            row_in_view -= visible_rows
+            cat_rows = None
+
+        if cat_rows is None:
+            cat_rows = sample_categories()
+        if cat_rows[row_in_view]:
             index += 1
             continue
 
-        col = placed % cfg.per_row
-        row = placed // cfg.per_row
-        world_pos = (
-            placement_origin[0] + col * cfg.spacing_pixels,
-            placement_origin[1] + row * cfg.spacing_pixels,
-        )
-
-        if cfg.dry_run:
-            print(f"Would click list entry at {list_pos} and place at {world_pos}")
-        else:
-            pyautogui.moveTo(*list_pos)
-            pyautogui.click()
-            time.sleep(cfg.click_delay)
-
-            pyautogui.moveTo(*world_pos)
-            pyautogui.click()
-            time.sleep(cfg.place_delay)
+        place_one(list_plan[row_in_view], next(world_plan))
 
         placed += 1
         index += 1
 
 
+# argparse destinations of the options that only apply to one workflow.
+PIXEL_ONLY_OPTIONS = (
+    "row_height",
+    "list_offset_x",
+    "list_offset_y",
+    "screen_height",
+    "spacing_pixels",
+    "click_delay",
+    "place_delay",
+    "scroll_clicks_per_row",
+    "scroll_delay",
+    "confidence",
+    "search_region",
+    "origin",
+    "category_color",
+    "category_tolerance",
+    "category_offset_x",
+)
+CLASS_LIST_ONLY_OPTIONS = ("sqf_out", "spacing_meters")
+
+
 def parse_args(argv: list[str]) -> PlacementConfig:
     parser = argparse.ArgumentParser(description="Place 3DEN objects with PyAutoGUI.")
     parser.add_argument(
         "anchor_template",
         type=Path,
-        help="Cropped screenshot of the top of the object browser (PNG recommended)",
+        nargs="?",
+        help="Cropped screenshot of the top of the object browser (PNG recommended; not needed with --class-list)",
     )
     parser.add_argument("--row-height", type=int, default=26, help="Pixel height of each object entry")
     parser.add_argument("--list-offset-x", type=int, default=10, help="Pixels from anchor's left to the first entry")
@@ -191,6 +704,13 @@ def parse_args(argv: list[str]) -> PlacementConfig:
     )
     parser.add_argument("--scroll-delay", type=float, default=0.15, help="Pause after scrolling to let the UI catch up")
     parser.add_argument("--confidence", type=float, default=0.9, help="Template matching confidence for finding the anchor")
+    parser.add_argument(
+        "--search-region",
+        type=int,
+        nargs=4,
+        metavar=("X", "Y", "W", "H"),
+        help="Only search this part of the screen for the anchor (defaults to the whole screen)",
+    )
     parser.add_argument(
         "--origin",
         type=int,
@@ -217,13 +737,62 @@ def parse_args(argv: list[str]) -> PlacementConfig:
         default=-14,
         help="Horizontal offset from the entry label to sample the category triangle pixel",
     )
+    parser.add_argument(
+        "--class-list",
+        type=Path,
+        default=None,
+        help="Text file of object class names, one per line, to place through the 3DEN scripting API instead of the UI",
+    )
+    parser.add_argument(
+        "--sqf-out",
+        type=Path,
+        default=None,
+        help="Where to write the SQF script generated for --class-list (defaults to printing it)",
+    )
+    parser.add_argument(
+        "--spacing-meters",
+        type=float,
+        default=5.0,
+        help="Spacing in metres between objects placed from --class-list",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Print planned clicks instead of moving the mouse (useful for validation)",
+        help="Print planned clicks instead of moving the mouse (useful for validation); with --class-list, print the script instead of writing --sqf-out",
     )
 
     args = parser.parse_args(argv)
+
+    if args.search_region is not None and min(args.search_region[2:]) <= 0:
+        parser.error("--search-region width and height must be positive")
+
+    # Options that only mean something to one workflow are rejected in the
+    # other rather than silently ignored.
+    conflicting: tuple[str, ...]
+    if args.class_list is not None:
+        if args.anchor_template is not None:
+            parser.error("anchor_template cannot be used with --class-list")
+        conflicting = PIXEL_ONLY_OPTIONS
+    else:
+        if args.anchor_template is None:
+            parser.error("anchor_template is required unless --class-list is given")
+        conflicting = CLASS_LIST_ONLY_OPTIONS
+    given = [
+        "--" + name.replace("_", "-")
+        for name in conflicting
+        if getattr(args, name) != parser.get_default(name)
+    ]
+    if given:
+        mode = "with" if args.class_list is not None else "without"
+        parser.error(f"{', '.join(given)} cannot be used {mode} --class-list")
+
+    template_gray = None
+    if args.anchor_template is not None and not args.dry_run:
+        try:
+            template_gray = load_template(args.anchor_template)
+        except RuntimeError as exc:
+            parser.error(str(exc))
+
     return PlacementConfig(
         anchor_template=args.anchor_template,
         row_height=args.row_height,
@@ -238,18 +807,24 @@ def parse_args(argv: list[str]) -> PlacementConfig:
         scroll_delay=args.scroll_delay,
         limit=args.limit,
         confidence=args.confidence,
+        search_region=tuple(args.search_region) if args.search_region else None,
         placement_origin=tuple(args.origin) if args.origin else None,
         category_color=tuple(args.category_color) if args.category_color else None,
         category_color_tolerance=args.category_tolerance,
         category_icon_offset_x=args.category_offset_x,
+        class_list=args.class_list,
+        sqf_out=args.sqf_out,
+        spacing_meters=args.spacing_meters,
         dry_run=args.dry_run,
+        template_gray=template_gray,
     )
 
 
 def main(argv: list[str]) -> int:
     cfg = parse_args(argv)
     try:
-        place_objects(cfg)
+        with fine_timer_resolution():
+            place_objects(cfg)
     except KeyboardInterrupt:
         print("Interrupted by user. Exiting cleanly.")
         return 1